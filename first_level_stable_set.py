@@ -68,11 +68,12 @@ def stable_set_problem_sdp(graph: Graph, verbose=False):
     A = graph.A
 
     # Coefficients of objective
-    densities_A = [
-        np.count_nonzero(A[monomial]) / A[monomial].size
-        for monomial in distinct_monomials
-    ]
-    # print("Densities of A: ", densities_A)
+    if verbose:
+        densities_A = [
+            np.count_nonzero(A[monomial]) / A[monomial].size
+            for monomial in distinct_monomials
+        ]
+        print("Densities of A: ", densities_A)
     C = {monomial: -1 if sum(monomial) == 1 else 0 for monomial in distinct_monomials}
 
     time_start = time.time()
@@ -88,22 +89,39 @@ def stable_set_problem_sdp(graph: Graph, verbose=False):
         tuple_of_constant = tuple([0 for i in range(len(distinct_monomials[0]))])
 
         # Constraints:
-        # A_i · X = c_i
-        constraints = []
-        for i, monomial in enumerate(
-            [m for m in distinct_monomials if m != tuple_of_constant]
-        ):
-            SOS_dot_X = mf.Expr.dot(A[monomial], X)
-            M.constraint(
-                SOS_dot_X,
-                mf.Domain.equalsTo(C[monomial]),
-            )
+        # A_i · X  = c_i        for all monomials
+        # A_0 · X + b = c_0     for the constant monomial
+        # One vector constraint from the svec triplets precomputed at
+        # graph build time, so no per-monomial Fusion calls are made.
+        # Row i holds svec(A_i) (off-diagonals doubled) and the last
+        # column carries the coefficient of b.
+        triu_rows, triu_cols = np.triu_indices(size_psd_variable)
+        svec_length = len(triu_rows)
+        svec_coo = getattr(graph, "A_svec_coo", None)
+        if svec_coo is None:
+            A_stack = np.stack(
+                [A[monomial] for monomial in distinct_monomials]
+            ).astype(np.float64)
+            svec_coo = generate_graphs.build_svec_coo(A_stack)
+        rows, cols, values = svec_coo
+        constant_index = distinct_monomials.index(tuple_of_constant)
+        # np.append promotes the indices to int64, which Fusion's
+        # Matrix.sparse rejects, so cast back to int32.
+        rows = np.append(rows, constant_index).astype(np.int32)
+        cols = np.append(cols, svec_length).astype(np.int32)
+        values = np.append(values, 1.0)
+
+        A_mat = mf.Matrix.sparse(
+            len(distinct_monomials), svec_length + 1, rows, cols, values
+        )
+        c_vec = np.array(
+            [C[monomial] for monomial in distinct_monomials], dtype=np.float64
+        )
 
-        # Constraint:
-        # A_0 · X + b = c_0
+        svec_X = X.pick(list(triu_rows), list(triu_cols))
         M.constraint(
-            mf.Expr.add(mf.Expr.dot(A[tuple_of_constant], X), b),
-            mf.Domain.equalsTo(C[tuple_of_constant]),
+            mf.Expr.mul(A_mat, mf.Expr.vstack(svec_X, b)),
+            mf.Domain.equalsTo(c_vec),
         )
 
         if verbose:
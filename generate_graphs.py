@@ -12,6 +12,85 @@ import networkx as nx
 import time
 import random
 
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(parallel=True, cache=True)
+    def _svec_coo_jit(A_stack):  # pragma: no cover - exercised only with numba
+        no_matrices, n, _ = A_stack.shape
+        counts = np.zeros(no_matrices, dtype=np.int64)
+        for i in prange(no_matrices):
+            count = 0
+            for r in range(n):
+                for s in range(r, n):
+                    if A_stack[i, r, s] != 0.0:
+                        count += 1
+            counts[i] = count
+        offsets = np.zeros(no_matrices + 1, dtype=np.int64)
+        for i in range(no_matrices):
+            offsets[i + 1] = offsets[i] + counts[i]
+        # int32 indices: Mosek Fusion's Matrix.sparse rejects int64 arrays.
+        rows = np.empty(offsets[no_matrices], dtype=np.int32)
+        cols = np.empty(offsets[no_matrices], dtype=np.int32)
+        values = np.empty(offsets[no_matrices], dtype=np.float64)
+        for i in prange(no_matrices):
+            position = offsets[i]
+            for r in range(n):
+                # Start of row r in the row-major upper triangular order
+                row_offset = r * n - (r * (r - 1)) // 2
+                for s in range(r, n):
+                    value = A_stack[i, r, s]
+                    if value != 0.0:
+                        rows[position] = i
+                        cols[position] = row_offset + (s - r)
+                        if s == r:
+                            values[position] = value
+                        else:
+                            values[position] = 2.0 * value
+                        position += 1
+        return rows, cols, values
+
+
+def build_svec_coo(A_stack):
+    """
+    Get the COO triplets of the stacked svec(A_i) matrix.
+
+    Row i holds the upper triangle of A_i with off-diagonal entries
+    doubled, so that the row times svec(X) equals the inner product
+    A_i · X. Uses a parallel numba kernel when numba is installed and a
+    vectorized numpy fallback otherwise.
+
+    Parameters
+    ----------
+    A_stack : numpy.ndarray
+        Array of shape (no. matrices, n, n) with the stacked A matrices.
+
+    Returns
+    -------
+    tuple
+        Tuple (rows, columns, values) of the nonzero entries of the
+        (no. matrices, n(n+1)/2) svec matrix.
+
+    """
+
+    if NUMBA_AVAILABLE:
+        return _svec_coo_jit(np.ascontiguousarray(A_stack, dtype=np.float64))
+
+    triu_rows, triu_cols = np.triu_indices(A_stack.shape[1])
+    A_sv = A_stack[:, triu_rows, triu_cols].astype(np.float64)
+    A_sv[:, triu_rows != triu_cols] *= 2
+    rows, cols = np.nonzero(A_sv)
+
+    # int32 indices: Mosek Fusion's Matrix.sparse rejects int64 arrays.
+    return rows.astype(np.int32), cols.astype(np.int32), A_sv[rows, cols]
+
 
 class Graph:
     def __init__(self):
@@ -80,6 +159,11 @@ class Graph:
             print("Done building Ai matrices for level 1")
 
         self.A = A
+        self.A_svec_coo = build_svec_coo(
+            np.stack([A[monomial] for monomial in distinct_monomials]).astype(
+                np.float64
+            )
+        )
 
     def get_picking_edges(self, verbose=False):
         """ """
@@ -135,9 +219,49 @@ class Graph:
             )
         print("Time taken building Ai matrices for level 2:", time.time() - start)
 
+        # Stack the A matrices into a contiguous 3-D array so that the
+        # projection P A_i P^T can be done as two batched matrix products
+        # instead of one Python-level call per monomial.
+        self.A_L2_stack = np.stack(
+            [self.A_L2[monomial] for monomial in self.distinct_monomials_L2]
+        ).astype(np.float64)
+        self.A_L2_svec_coo = build_svec_coo(self.A_L2_stack)
+        # Objective coefficients: -1 for the degree one monomials,
+        # 0 otherwise, computed over the whole monomial array at once.
+        self.monomials_arr_L2 = np.array(self.distinct_monomials_L2, dtype=np.int8)
+        self.C_L2 = -(self.monomials_arr_L2.sum(axis=1) == 1).astype(np.float64)
+        # Constant monomial and objective mask for the slack variables,
+        # rebuilt on every solver call before they were stored here.
+        self.tuple_of_constant_L2 = tuple(
+            0 for _ in range(len(self.distinct_monomials_L2[0]))
+        )
+        self.ones_vector_L2 = np.ones(len(self.distinct_monomials_L2) - 1)
+        self.ones_vector_L2[0] = 0
+        self.constant_index_L2 = self.distinct_monomials_L2.index(
+            self.tuple_of_constant_L2
+        )
+        self.constraint_monomials_L2 = [
+            monomial
+            for monomial in self.distinct_monomials_L2
+            if monomial != self.tuple_of_constant_L2
+        ]
+
         if verbose:
             print("Done building Ai matrices for level 2")
 
+    def __getstate__(self):
+        """
+        Drop the large derived arrays from the pickle; store_graph saves
+        them as .npy files next to the pickle so load_graph can memory-map
+        them instead of deserializing multi-MB arrays on every run.
+
+        """
+
+        state = self.__dict__.copy()
+        for attribute in ("A_L2_stack", "A_L2_svec_coo"):
+            state.pop(attribute, None)
+        return state
+
     def store_graph(self, name):
         """
         Store the graph in a folder inside the 'graphs' folder.
@@ -160,6 +284,16 @@ class Graph:
             # Serialize and save the object to the file
             pickle.dump(self, file)
 
+        # Save the derived arrays separately so they can be memory-mapped
+        # on load instead of rebuilt or re-deserialized.
+        if getattr(self, "A_L2_stack", None) is not None:
+            np.save(directory + "/A_L2_stack.npy", self.A_L2_stack)
+        if getattr(self, "A_L2_svec_coo", None) is not None:
+            rows, cols, values = self.A_L2_svec_coo
+            np.save(directory + "/A_L2_svec_rows.npy", rows)
+            np.save(directory + "/A_L2_svec_cols.npy", cols)
+            np.save(directory + "/A_L2_svec_vals.npy", values)
+
         print("Graph stored in: ", file_path)
 
     def plot_graph(self):
@@ -203,6 +337,55 @@ class Graph:
         self.graph = graph
 
 
+_graph_cache = {}
+
+
+def load_graph(directory):
+    """
+    Load a stored graph, reusing it across calls within the same run.
+
+    The pickle is only deserialized once per directory, and the derived
+    arrays saved by store_graph are attached by memory-mapping the .npy
+    files (or rebuilt for graphs stored before they existed).
+
+    Parameters
+    ----------
+    directory : str
+        Directory with the stored graph, e.g. 'graphs/pentagon'.
+
+    Returns
+    -------
+    Graph
+        Graph object.
+
+    """
+
+    key = os.path.abspath(directory)
+    if key in _graph_cache:
+        return _graph_cache[key]
+
+    with open(directory + "/graph.pkl", "rb") as file:
+        graph = pickle.load(file)
+
+    stack_path = directory + "/A_L2_stack.npy"
+    if os.path.exists(stack_path):
+        graph.A_L2_stack = np.load(stack_path, mmap_mode="r")
+        graph.A_L2_svec_coo = (
+            np.load(directory + "/A_L2_svec_rows.npy", mmap_mode="r"),
+            np.load(directory + "/A_L2_svec_cols.npy", mmap_mode="r"),
+            np.load(directory + "/A_L2_svec_vals.npy", mmap_mode="r"),
+        )
+    elif getattr(graph, "A_L2", None) is not None:
+        graph.A_L2_stack = np.stack(
+            [graph.A_L2[monomial] for monomial in graph.distinct_monomials_L2]
+        ).astype(np.float64)
+        graph.A_L2_svec_coo = build_svec_coo(graph.A_L2_stack)
+
+    _graph_cache[key] = graph
+
+    return graph
+
+
 def generate_pentagon(complement=False):
     """
     Generate a pentagon graph.
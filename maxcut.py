@@ -109,10 +109,12 @@ def sdp_relaxation(graph):
             "edges": len(graph.edges),
         }
 
-        # print("The nuclear norm the solution matrix is: ", np.linalg.norm(solution["X_sol"], "nuc"))
-        # print("The frobenius norm of the solution matrix is: ", np.linalg.norm(solution["X_sol"], "fro"))
-        # print("The nuclear norm of the laplacian matrix is: ", np.linalg.norm(L, "nuc"))
-        # print("The frobenius norm of the laplacian matrix is: ", np.linalg.norm(L, "fro"))
+        # nuclear_X, _, frobenius_X = monomials.matrix_stats(X.level().reshape((n, n)))
+        # print("The nuclear norm the solution matrix is: ", nuclear_X)
+        # print("The frobenius norm of the solution matrix is: ", frobenius_X)
+        # nuclear_L, _, frobenius_L = monomials.matrix_stats(L)
+        # print("The nuclear norm of the laplacian matrix is: ", nuclear_L)
+        # print("The frobenius norm of the laplacian matrix is: ", frobenius_L)
 
         return solution
 
@@ -11,6 +11,43 @@ import time
 from ordered_set import OrderedSet
 
 
+def matrix_stats(matrix, tolerance=1e-10):
+    """
+    Get the nuclear norm, numerical rank, and Frobenius norm of a matrix
+    from a single SVD.
+
+    The nuclear norm is the sum of the singular values, the rank the
+    number of singular values above tolerance (relative to the largest),
+    and the Frobenius norm the Euclidean norm of the singular values, so
+    one decomposition gives all three.
+
+    Parameters
+    ----------
+    matrix : numpy.ndarray
+        Matrix to analyse.
+    tolerance : float
+        Relative tolerance for counting a singular value as nonzero.
+
+    Returns
+    -------
+    tuple
+        Tuple (nuclear norm, rank, Frobenius norm).
+
+    """
+
+    # LAPACK wants Fortran order; converting here avoids an internal copy
+    # for C-ordered input.
+    singular_values = np.linalg.svd(np.asfortranarray(matrix), compute_uv=False)
+    if singular_values.size == 0 or singular_values[0] == 0:
+        return 0.0, 0, 0.0
+
+    nuclear_norm = singular_values.sum()
+    rank = int((singular_values > singular_values[0] * tolerance).sum())
+    frobenius_norm = np.linalg.norm(singular_values)
+
+    return nuclear_norm, rank, frobenius_norm
+
+
 def sum_tuples(t1, t2):
     """
     Sums two tuples element-wise.
@@ -5,6 +5,7 @@ The module contains functions to generate random projectors.
 """
 
 import numpy as np
+import scipy.sparse
 
 
 class RandomProjector:
@@ -43,6 +44,18 @@ class RandomProjector:
         self.type = type
         np.random.seed(seed)
         self.projector = self.generate_random_projector()
+        # The Achlioptas-style +-1 projectors are kept in CSR form as
+        # well, so the projection cost scales with the density of P
+        # instead of its full size. Kept in float64: apply_rp_map_stack
+        # downcasts its own copy where single precision is acceptable.
+        if self.type in ("sparse", "sparser"):
+            self.projector_csr = scipy.sparse.csr_matrix(self.projector)
+        else:
+            self.projector_csr = None
+        # Cache of projected matrices keyed by matrix content, so that
+        # repeated patterns among the A matrices are only projected once
+        # per projector.
+        self.projection_cache = {}
 
     def generate_random_projector(self):
         """
@@ -190,7 +203,64 @@ class RandomProjector:
 
         """
 
-        return (self.projector @ matrix) @ self.projector.T
+        key = (matrix.shape, matrix.tobytes())
+        projected_matrix = self.projection_cache.get(key)
+        if projected_matrix is None:
+            if self.projector_csr is not None:
+                # P A P^T = (P (P A)^T)^T keeps both products sparse-dense.
+                tmp = self.projector_csr @ matrix
+                projected_matrix = np.asarray(
+                    (self.projector_csr @ tmp.T).T, dtype=np.float64
+                )
+            else:
+                projected_matrix = (self.projector @ matrix) @ self.projector.T
+            self.projection_cache[key] = projected_matrix
+
+        return projected_matrix
+
+    def apply_rp_map_stack(self, stack):
+        """
+        Applies the random projection map m_P(A):A --> PAP^T to a stack
+        of matrices at once.
+
+        The stack has shape (no. matrices, m, m), so both products are
+        batched matrix multiplications handled by BLAS in one call each.
+        The products are done in single precision: the projection is an
+        epsilon-approximation anyway, and halving the memory bandwidth
+        nearly doubles the throughput of this memory-bound step. The
+        result is cast back to float64 before handing it to Mosek.
+
+        Parameters
+        ----------
+        stack : numpy.ndarray
+            Array of shape (no. matrices, m, m) with the matrices to be
+            projected.
+
+        Returns
+        -------
+        projected_stack : numpy.ndarray
+            Array of shape (no. matrices, k, k) with the projected matrices.
+
+        """
+
+        stack = stack.astype(np.float32)
+
+        if self.projector_csr is not None:
+            # scipy.sparse only multiplies 2-D operands, so fold the
+            # batch dimension into the columns for both products.
+            projector_csr = self.projector_csr.astype(np.float32)
+            no_matrices, m, _ = stack.shape
+            tmp = projector_csr @ stack.transpose(1, 0, 2).reshape(m, -1)
+            tmp = tmp.reshape(self.k, no_matrices, m).transpose(1, 0, 2)
+            projected = projector_csr @ tmp.transpose(2, 0, 1).reshape(m, -1)
+            projected = projected.reshape(self.k, no_matrices, self.k).transpose(
+                1, 2, 0
+            )
+            return np.ascontiguousarray(projected, dtype=np.float64)
+
+        projector = self.projector.astype(np.float32)
+
+        return np.matmul(np.matmul(projector, stack), projector.T).astype(np.float64)
 
     def lift_solution(self, solution):
         """
@@ -3,8 +3,12 @@
 """
 
 import sys
+import os
+import math
 import time
+import concurrent.futures
 import numpy as np
+import scipy.optimize
 import mosek.fusion as mf
 import monomials
 import pickle
@@ -15,6 +19,35 @@ import random_projections as rp
 import generate_graphs
 
 
+def coefficient_vector_L2(graph):
+    """
+    Get the objective coefficients of the second level as a vector.
+
+    The coefficient is -1 for the degree one monomials and 0 otherwise,
+    in the order of graph.distinct_monomials_L2. Uses the vector stored
+    at graph build time and only recomputes it for graphs pickled before
+    it was introduced.
+
+    Parameters
+    ----------
+    graph : Graph
+        Graph object.
+
+    Returns
+    -------
+    numpy.ndarray
+        Vector of objective coefficients.
+
+    """
+
+    c_vec = getattr(graph, "C_L2", None)
+    if c_vec is None:
+        monomials_arr = np.array(graph.distinct_monomials_L2, dtype=np.int8)
+        c_vec = -(monomials_arr.sum(axis=1) == 1).astype(np.float64)
+
+    return c_vec
+
+
 def second_level_stable_set_problem_sdp(graph, verbose=False):
     """
     Write the second level of polynomial optimization problem for the stable set problem.
@@ -40,7 +73,7 @@ def second_level_stable_set_problem_sdp(graph, verbose=False):
     edges = graph.edges
 
     # Coefficients of objective
-    C = {monomial: -1 if sum(monomial) == 1 else 0 for monomial in distinct_monomials}
+    c_vec = coefficient_vector_L2(graph)
 
     # Picking SOS monomials
     A = graph.A_L2
@@ -56,36 +89,48 @@ def second_level_stable_set_problem_sdp(graph, verbose=False):
         b = M.variable()
         M.objective(mf.ObjectiveSense.Maximize, b)
 
-        tuple_of_constant = tuple([0 for i in range(len(distinct_monomials[0]))])
+        tuple_of_constant = getattr(
+            graph,
+            "tuple_of_constant_L2",
+            tuple(0 for i in range(len(distinct_monomials[0]))),
+        )
 
         # Constraints:
-        # A_i · X  = c_i
-        constraints = []
-        for i, monomial in enumerate(
-            [m for m in distinct_monomials if m != tuple_of_constant]
-        ):
-            print(
-                "Adding constraints... {}/{}          ".format(
-                    i + 1, len(distinct_monomials) - 1
-                ),
-                end="\r",
-            )
-            # print("Building constraint for monomial {} out of {}".format(i, len(distinct_monomials)))
-            SOS_dot_X = mf.Expr.dot(A[monomial], X)
-
-            constraint = M.constraint(
-                SOS_dot_X,
-                mf.Domain.equalsTo(C[monomial]),
-            )
-            constraints.append(constraint)
+        # A_i · X  = c_i        for all monomials
+        # A_0 · X + b = c_0     for the constant monomial
+        # Built as a single vector constraint A_sv (svec(X), b) = c to
+        # avoid one Fusion call per monomial. A_i and X are symmetric, so
+        # only the upper triangle of X is needed: row i of A_sv holds the
+        # upper triangle of A_i with off-diagonal entries doubled (so that
+        # the row times svec(X) equals the full inner product A_i · X),
+        # and the last column carries the coefficient of b.
+        triu_rows, triu_cols = np.triu_indices(size_psd_variable)
+        svec_length = len(triu_rows)
+        svec_coo = getattr(graph, "A_L2_svec_coo", None)
+        if svec_coo is None:
+            A_stack = np.stack(
+                [A[monomial] for monomial in distinct_monomials]
+            ).astype(np.float64)
+            svec_coo = generate_graphs.build_svec_coo(A_stack)
+        rows, cols, values = svec_coo
+        constant_index = getattr(
+            graph, "constant_index_L2", distinct_monomials.index(tuple_of_constant)
+        )
+        # np.append promotes the indices to int64, which Fusion's
+        # Matrix.sparse rejects, so cast back to int32.
+        rows = np.append(rows, constant_index).astype(np.int32)
+        cols = np.append(cols, svec_length).astype(np.int32)
+        values = np.append(values, 1.0)
+
+        A_mat = mf.Matrix.sparse(
+            len(distinct_monomials), svec_length + 1, rows, cols, values
+        )
 
-        # Constraint:
-        # A_0 · X + b = c_0
-        c0 = M.constraint(
-            mf.Expr.add(mf.Expr.dot(A[tuple_of_constant], X), b),
-            mf.Domain.equalsTo(C[tuple_of_constant]),
+        svec_X = X.pick(list(triu_rows), list(triu_cols))
+        constraint = M.constraint(
+            mf.Expr.mul(A_mat, mf.Expr.vstack(svec_X, b)),
+            mf.Domain.equalsTo(c_vec),
         )
-        constraints.append(c0)
         time_end = time.time()
         # print("Time to build Mosek model: {}".format(time_end - time_start))
 
@@ -100,10 +145,18 @@ def second_level_stable_set_problem_sdp(graph, verbose=False):
         end_time = time.time()
 
         # Get the solution
-        X_sol = X.level()
+        X_sol = X.level().reshape(size_psd_variable, size_psd_variable)
         b_sol = b.level()
         computation_time = end_time - start_time
 
+        if verbose:
+            nuclear_norm, rank, frobenius_norm = monomials.matrix_stats(X_sol)
+            print(
+                "Solution matrix: rank {}, nuclear norm {:.4f}, frobenius norm {:.4f}".format(
+                    rank, nuclear_norm, frobenius_norm
+                )
+            )
+
         solution = {
             # "X": X_sol,
             # "b": b_sol,
@@ -112,31 +165,121 @@ def second_level_stable_set_problem_sdp(graph, verbose=False):
             "size_psd_variable": size_psd_variable,
             # "no_linear_variables": "TBC",
             "edges": len(edges),
-            "no_constraints": len(constraints) + 1,
+            "no_constraints": len(distinct_monomials) + 1,
         }
 
         return solution
 
 
+def project_A_L2(graph, projector):
+    """
+    Project all A matrices of the second level with a given projector.
+
+    Uses the stacked representation of the A matrices when available so
+    that the projection P A_i P^T is two batched matrix products instead
+    of one Python-level call per monomial.
+
+    Parameters
+    ----------
+    graph : Graph
+        Graph object.
+    projector : RandomProjector
+        Random projector.
+
+    Returns
+    -------
+    dict
+        Dictionary monomial --> projected A matrix.
+
+    """
+
+    A_stack = getattr(graph, "A_L2_stack", None)
+    if A_stack is None:
+        A_stack = np.stack(
+            [graph.A_L2[monomial] for monomial in graph.distinct_monomials_L2]
+        ).astype(np.float64)
+    projected_stack = projector.apply_rp_map_stack(A_stack)
+
+    return {
+        monomial: projected_stack[i]
+        for i, monomial in enumerate(graph.distinct_monomials_L2)
+    }
+
+
 def projected_second_level_stable_set_problem_sdp(
-    graph, projector, verbose=False, slack=True
+    graph,
+    projector,
+    verbose=False,
+    slack=True,
+    A_projected=None,
+    warm_start_X=None,
+    num_threads=None,
+    bm=False,
+    bm_rank=None,
 ):
-    """ """
+    """
+    Write the projected second level problem for the stable set problem.
+
+    Parameters
+    ----------
+    graph : Graph
+        Graph object.
+    projector : RandomProjector
+        Random projector.
+    A_projected : dict, optional
+        Already projected A matrices for this projector. If not given,
+        the projection P A_i P^T is computed here.
+    warm_start_X : numpy.ndarray, optional
+        Solution matrix of the unprojected problem. Only used by the
+        Burer-Monteiro branch to seed the factorization; the conic
+        interior-point optimizer ignores initial levels.
+    num_threads : int, optional
+        Number of threads Mosek may use. Set to a small value when
+        several solves run in parallel processes.
+    bm : bool
+        If True, solve with a Burer-Monteiro factorization X = V V^T
+        instead of the full PSD cone.
+    bm_rank : int, optional
+        Rank of the factorization when bm is True.
+
+    Returns
+    -------
+    dict
+        Dictionary with the solutions of the sdp relaxation.
+
+    """
+
+    if bm:
+        return burer_monteiro_second_level_sdp(
+            graph,
+            projector,
+            rank=bm_rank,
+            A_projected=A_projected,
+            warm_start_X=warm_start_X,
+            verbose=verbose,
+        )
 
     distinct_monomials = graph.distinct_monomials_L2
     edges = graph.edges
 
     # Coefficients of objective
-    C = {monomial: -1 if sum(monomial) == 1 else 0 for monomial in distinct_monomials}
+    c_vec = coefficient_vector_L2(graph)
 
-    A = graph.A_L2
-    A = {monomial: projector.apply_rp_map(A[monomial]) for monomial in A.keys()}
+    if A_projected is None:
+        A = project_A_L2(graph, projector)
+    else:
+        A = A_projected
 
     # print("Starting Mosek")
     time_start = time.time()
     with mf.Model("SDP") as M:
         # PSD variable X
         size_psd_variable = A[distinct_monomials[0]].shape[0]
+        if num_threads is not None:
+            M.setSolverParam("numThreads", num_threads)
+        # After the projection the A_i are fully dense, so presolve's
+        # sparsity analyses only cost time and memory here.
+        M.setSolverParam("presolveUse", "off")
         X = M.variable(mf.Domain.inPSDCone(size_psd_variable))
 
         # Lower and upper bounds
@@ -153,8 +296,10 @@ def projected_second_level_stable_set_problem_sdp(
             dual_lower_bound = 0 - epsilon
             dual_upper_bound = 1 + epsilon
 
-        ones_vector = np.ones(len(distinct_monomials) - 1)
-        ones_vector[0] = 0
+        ones_vector = getattr(graph, "ones_vector_L2", None)
+        if ones_vector is None:
+            ones_vector = np.ones(len(distinct_monomials) - 1)
+            ones_vector[0] = 0
 
         # Objective: maximize a (scalar)
         b = M.variable()
@@ -178,47 +323,43 @@ def projected_second_level_stable_set_problem_sdp(
         else:
             M.objective(mf.ObjectiveSense.Maximize, b)
 
-        tuple_of_constant = tuple([0 for i in range(len(distinct_monomials[0]))])
+        tuple_of_constant = getattr(
+            graph,
+            "tuple_of_constant_L2",
+            tuple(0 for i in range(len(distinct_monomials[0]))),
+        )
+        constant_index = getattr(
+            graph, "constant_index_L2", distinct_monomials.index(tuple_of_constant)
+        )
 
         # Constraints:
         # A_i · X + lbv[i] - ubv[i] = c_i
-        constraints = []
-        for i, monomial in enumerate(
-            [m for m in distinct_monomials if m != tuple_of_constant]
-        ):
-            print(
-                "Adding constraints... {}/{}          ".format(
-                    i + 1, len(distinct_monomials) - 1
-                ),
-                end="\r",
-            )
-            # print("Building constraint for monomial {} out of {}".format(i, len(distinct_monomials)))
-            SOS_dot_X = mf.Expr.dot(A[monomial], X)
-
-            if slack:
-                difference_slacks = mf.Expr.sub(
-                    lb_variables.index(i),
-                    ub_variables.index(i),
-                )
-            else:
-                difference_slacks = 0
+        # Built as one vector constraint over svec(X), so X stays a
+        # single bar variable and no per-monomial Fusion calls (with the
+        # scalar-variable blowup they can trigger) are made. The
+        # projected A_i are dense, so their svec rows stay dense too.
+        projected_stack = np.asarray(
+            [A[monomial] for monomial in distinct_monomials]
+        )
+        triu_rows, triu_cols = np.triu_indices(size_psd_variable)
+        A_sv = projected_stack[:, triu_rows, triu_cols]
+        A_sv[:, triu_rows != triu_cols] *= 2
+        non_constant = np.arange(len(distinct_monomials)) != constant_index
 
-            c = M.constraint(
-                mf.Expr.add(
-                    SOS_dot_X,
-                    difference_slacks,
-                ),
-                mf.Domain.equalsTo(C[monomial]),
-            )
-            constraints.append(c)
+        svec_X = X.pick(list(triu_rows), list(triu_cols))
+        lhs = mf.Expr.mul(mf.Matrix.dense(A_sv[non_constant]), svec_X)
+        if slack:
+            lhs = mf.Expr.add(lhs, mf.Expr.sub(lb_variables, ub_variables))
+        constraints = M.constraint(
+            lhs, mf.Domain.equalsTo(c_vec[non_constant])
+        )
 
         # Constraint:
         # A_0 · X + b  = c_0
         c0 = M.constraint(
             mf.Expr.add(mf.Expr.dot(A[tuple_of_constant], X), b),
-            mf.Domain.equalsTo(C[tuple_of_constant]),
+            mf.Domain.equalsTo(c_vec[constant_index]),
         )
-        constraints.append(c0)
         time_end = time.time()
         # print("Time to build Mosek model: {}".format(time_end - time_start))
 
@@ -238,7 +379,7 @@ def projected_second_level_stable_set_problem_sdp(
         computation_time = end_time - start_time
 
         if slack:
-            linear_variables = 2 * len(constraints) + 1
+            linear_variables = 2 * (len(distinct_monomials) - 1) + 1
         else:
             linear_variables = 1
 
@@ -250,26 +391,164 @@ def projected_second_level_stable_set_problem_sdp(
             "size_psd_variable": size_psd_variable,
             # "no_linear_variables": "TBC",
             "edges": len(edges),
-            "no_constraints": len(constraints) + 1,
+            "no_constraints": len(distinct_monomials) + 1,
         }
 
         return solution
 
 
+def burer_monteiro_second_level_sdp(
+    graph,
+    projector,
+    rank=None,
+    penalty=1000.0,
+    A_projected=None,
+    warm_start_X=None,
+    verbose=False,
+):
+    """
+    Solve the projected second level problem with a Burer-Monteiro
+    factorization X = V V^T instead of the full PSD cone.
+
+    The random projection approximately preserves rank, so the projected
+    solution matrix is low rank and V only needs k x rank entries with
+    rank << k. Maximizing b = c_0 - A_0 · X with the equality
+    constraints A_i · X = c_i enforced by a quadratic penalty gives the
+    nonlinear program
+
+    minimize    A_0 · V V^T + penalty * sum_i (A_i · V V^T - c_i)^2
+
+    which is solved with L-BFGS-B and the analytical gradient
+    2 (A_0 + 2 penalty sum_i r_i A_i) V.
+
+    Parameters
+    ----------
+    graph : Graph
+        Graph object.
+    projector : RandomProjector
+        Random projector.
+    rank : int, optional
+        Rank of the factorization. Defaults to the Barvinok-Pataki
+        bound r(r+1)/2 >= no. constraints.
+    penalty : float
+        Weight of the quadratic penalty on the equality constraints.
+    A_projected : dict, optional
+        Already projected A matrices for this projector.
+    warm_start_X : numpy.ndarray, optional
+        Solution matrix of the unprojected problem, used to initialize V
+        from the top eigenvectors of its projection.
+
+    Returns
+    -------
+    dict
+        Dictionary with the solutions of the relaxation.
+
+    """
+
+    distinct_monomials = graph.distinct_monomials_L2
+    edges = graph.edges
+    c_vec = coefficient_vector_L2(graph)
+    tuple_of_constant = getattr(
+        graph,
+        "tuple_of_constant_L2",
+        tuple(0 for i in range(len(distinct_monomials[0]))),
+    )
+    constant_index = getattr(
+        graph, "constant_index_L2", distinct_monomials.index(tuple_of_constant)
+    )
+
+    if A_projected is None:
+        A_projected = project_A_L2(graph, projector)
+    projected_stack = np.asarray(
+        [A_projected[monomial] for monomial in distinct_monomials]
+    )
+    size_psd_variable = projected_stack.shape[1]
+
+    non_constant = np.arange(len(distinct_monomials)) != constant_index
+    A_0 = projected_stack[constant_index]
+    A_rest = projected_stack[non_constant]
+    c_rest = c_vec[non_constant]
+    c_0 = c_vec[constant_index]
+
+    if rank is None:
+        # Barvinok-Pataki: some optimal X has rank r with
+        # r(r+1)/2 <= no. constraints.
+        rank = int(np.ceil((np.sqrt(8 * len(distinct_monomials) + 1) - 1) / 2))
+        rank = min(rank, size_psd_variable)
+
+    if warm_start_X is not None:
+        eigenvalues, eigenvectors = np.linalg.eigh(
+            projector.apply_rp_map(warm_start_X)
+        )
+        top = np.argsort(eigenvalues)[::-1][:rank]
+        V_0 = eigenvectors[:, top] * np.sqrt(np.maximum(eigenvalues[top], 0))
+    else:
+        np.random.seed(0)
+        V_0 = np.random.randn(size_psd_variable, rank) / np.sqrt(rank)
+
+    def objective_and_gradient(v):
+        V = v.reshape(size_psd_variable, rank)
+        X = V @ V.T
+        residuals = np.tensordot(A_rest, X, axes=([1, 2], [0, 1])) - c_rest
+        objective = np.sum((A_0 @ V) * V) + penalty * residuals @ residuals
+        gradient = (
+            2
+            * (A_0 + 2 * penalty * np.tensordot(residuals, A_rest, axes=(0, 0)))
+            @ V
+        )
+        return objective, gradient.ravel()
+
+    start_time = time.time()
+    result = scipy.optimize.minimize(
+        objective_and_gradient,
+        V_0.ravel(),
+        jac=True,
+        method="L-BFGS-B",
+        options={"maxiter": 1000},
+    )
+    end_time = time.time()
+
+    V = result.x.reshape(size_psd_variable, rank)
+    objective = c_0 - np.sum((A_0 @ V) * V)
+
+    if verbose:
+        print(
+            "Burer-Monteiro: rank {}, {} iterations, final penalty residual {:.2e}".format(
+                rank,
+                result.nit,
+                np.linalg.norm(
+                    np.tensordot(A_rest, V @ V.T, axes=([1, 2], [0, 1])) - c_rest
+                ),
+            )
+        )
+
+    solution = {
+        # "X": V @ V.T,
+        "objective": objective,
+        "computation_time": end_time - start_time,
+        "size_psd_variable": size_psd_variable,
+        "edges": len(edges),
+        "no_constraints": len(distinct_monomials) + 1,
+    }
+
+    return solution
+
+
 def constraint_aggregation(graph, projector, verbose=False):
     """ """
 
     distinct_monomials = graph.distinct_monomials_L2
     edges = graph.edges
+    tuple_of_constant = getattr(
+        graph,
+        "tuple_of_constant_L2",
+        tuple(0 for i in range(len(distinct_monomials[0]))),
+    )
 
-    # Coefficients of objective
-    C = {monomial: -1 if sum(monomial) == 1 else 0 for monomial in distinct_monomials}
-    C_old = C.copy()
-    for i in range(projector.k):
-        C[i] = 0
-        for j, monomial in enumerate(distinct_monomials):
-            # if monomial != tuple_of_constant:
-            C[i] += projector.projector[i, j] * C_old[monomial]
+    # Coefficients of objective, aggregated with the projector rows
+    c_vec = coefficient_vector_L2(graph)
+    C = dict(zip(distinct_monomials, c_vec))
+    C.update(enumerate(projector.projector @ c_vec))
 
     # Picking SOS monomials
     A = graph.A_L2
@@ -293,20 +572,22 @@ def constraint_aggregation(graph, projector, verbose=False):
         b = M.variable()
         M.objective(mf.ObjectiveSense.Maximize, b)
 
-        tuple_of_constant = tuple([0 for i in range(len(distinct_monomials[0]))])
-
         # Constraints:
         # A_i · X  = c_i
         constraints = []
-        for i, monomial in enumerate(
-            [m for m in distinct_monomials if m != tuple_of_constant]
-        ):
-            print(
-                "Adding constraints... {}/{}          ".format(
-                    i + 1, len(distinct_monomials) - 1
-                ),
-                end="\r",
-            )
+        constraint_monomials = getattr(graph, "constraint_monomials_L2", None)
+        if constraint_monomials is None:
+            constraint_monomials = [
+                m for m in distinct_monomials if m != tuple_of_constant
+            ]
+        for i, monomial in enumerate(constraint_monomials):
+            if verbose:
+                print(
+                    "Adding constraints... {}/{}          ".format(
+                        i + 1, len(distinct_monomials) - 1
+                    ),
+                    end="\r",
+                )
             # print("Building constraint for monomial {} out of {}".format(i, len(distinct_monomials)))
             SOS_dot_X = mf.Expr.dot(A[monomial], X)
 
@@ -356,16 +637,44 @@ def constraint_aggregation(graph, projector, verbose=False):
 
 
 def projected_dimension(epsilon, probability, ranks_Ai, rank_solution):
-    """ """
+    """
+    Johnson-Lindenstrauss style lower bound on the projected dimension.
 
-    sum_ranks = 8 * rank_solution + sum(ranks_Ai)
+    To preserve the problem data up to distortion epsilon with failure
+    probability at most `probability`, the projected dimension d must
+    satisfy
+
+        d >= log(sum of ranks / probability) / (epsilon^2/2 - epsilon^3/3)
+
+    where the epsilon term divides (not multiplies) the logarithm.
+    Plain scalar math avoids allocating 0-d numpy arrays here.
+
+    Parameters
+    ----------
+    epsilon : float
+        Distortion of the projection.
+    probability : float
+        Admissible failure probability.
+    ranks_Ai : list
+        Ranks of the data matrices.
+    rank_solution : int
+        Rank of the solution matrix.
+
+    Returns
+    -------
+    float
+        Lower bound on the projected dimension.
+
+    """
 
-    epsilon_part = np.exp(2 * (epsilon**2 / 2 - epsilon**3 / 3))
+    sum_ranks = 8 * rank_solution + sum(ranks_Ai)
 
-    d = np.log(sum_ranks / probability) * epsilon_part
+    d = math.log(sum_ranks / probability) / (epsilon**2 / 2 - epsilon**3 / 3)
 
     print("Projected dimension has to be at least: {}".format(d))
 
+    return d
+
 
 def random_constraint_aggregation_sdp(graph, projector, verbose=False):
     """
@@ -383,19 +692,14 @@ def random_constraint_aggregation_sdp(graph, projector, verbose=False):
 
     distinct_monomials = graph.distinct_monomials_L2
     edges = graph.edges
-    tuple_of_constant = tuple([0 for i in range(len(distinct_monomials[0]))])
-
-    # Coefficients of objective
-    C = {monomial: -1 if sum(monomial) == 1 else 0 for monomial in distinct_monomials}
+    tuple_of_constant = getattr(
+        graph,
+        "tuple_of_constant_L2",
+        tuple(0 for i in range(len(distinct_monomials[0]))),
+    )
 
-    # Get new set of rhs by randomly combining previous ones
-    C_old = C.copy()
-    C = {}
-    for i in range(projector.k):
-        C[i] = 0
-        for j, monomial in enumerate(distinct_monomials):
-            # if monomial != tuple_of_constant:
-            C[i] += projector.projector[i, j] * C_old[monomial]
+    # Coefficients of objective, randomly combined with the projector rows
+    C = dict(enumerate(projector.projector @ coefficient_vector_L2(graph)))
 
     A = graph.A_L2
     A_old = A.copy()
@@ -476,22 +780,18 @@ def combined_projection(
 ):
     distinct_monomials = graph.distinct_monomials_L2
     edges = graph.edges
-    tuple_of_constant = tuple([0 for i in range(len(distinct_monomials[0]))])
-
-    # Coefficients of objective
-    C = {monomial: -1 if sum(monomial) == 1 else 0 for monomial in distinct_monomials}
+    tuple_of_constant = getattr(
+        graph,
+        "tuple_of_constant_L2",
+        tuple(0 for i in range(len(distinct_monomials[0]))),
+    )
 
-    # Get new set of rhs by randomly combining previous ones
-    C_old = C.copy()
-    C = {}
-    for i in range(projector_constraints.k):
-        C[i] = 0
-        for j, monomial in enumerate(distinct_monomials):
-            # if monomial != tuple_of_constant:
-            C[i] += projector_constraints.projector[i, j] * C_old[monomial]
+    # Coefficients of objective, randomly combined with the projector rows
+    C = dict(
+        enumerate(projector_constraints.projector @ coefficient_vector_L2(graph))
+    )
 
-    A = graph.A_L2
-    A = {monomial: projector_variables.apply_rp_map(A[monomial]) for monomial in A.keys()}
+    A = project_A_L2(graph, projector_variables)
     A_old = A.copy()
     A = {}
     for i in range(projector_constraints.k):
@@ -619,7 +919,66 @@ def alternating_projection_sdp(graph, solution_matrix, objective):
     return psd_X, old_b[tuple_of_constant] - psd_X[0, 0]
 
 
-def single_graph_results(graph: Graph, 
+# Graph shared by the sweep workers, set once per worker process by
+# _init_sweep_worker instead of being pickled into every task.
+_sweep_graph = None
+
+
+def _init_sweep_worker(graph):
+    """
+    Pool initializer: store the graph in a module global and rebuild the
+    stacked A matrices that __getstate__ drops from the pickle, so each
+    worker pays the stacking cost once instead of once per solve.
+
+    """
+
+    global _sweep_graph
+    if getattr(graph, "A_L2_stack", None) is None:
+        graph.A_L2_stack = np.stack(
+            [graph.A_L2[monomial] for monomial in graph.distinct_monomials_L2]
+        ).astype(np.float64)
+    _sweep_graph = graph
+
+
+def solve_projected_rate(args):
+    """
+    Solve one projected problem of the rate sweep against the graph
+    installed by _init_sweep_worker.
+
+    Module-level so that it can be pickled into worker processes.
+
+    Parameters
+    ----------
+    args : tuple
+        Tuple (rate, type of projector).
+
+    Returns
+    -------
+    tuple
+        Tuple (rate, solution dictionary).
+
+    """
+
+    rate, type_variable = args
+    graph = _sweep_graph
+    matrix_size = graph.A_L2[graph.distinct_monomials_L2[0]].shape[0]
+    random_projector = rp.RandomProjector(
+        round(matrix_size * rate), matrix_size, type=type_variable
+    )
+    # Limit Mosek's threads so the parallel workers do not oversubscribe
+    # the machine.
+    rp_solution = projected_second_level_stable_set_problem_sdp(
+        graph,
+        random_projector,
+        verbose=False,
+        slack=True,
+        num_threads=2,
+    )
+
+    return rate, rp_solution
+
+
+def single_graph_results(graph: Graph,
                          type_variable,
                          type_constraint, 
                          range=(0.1, 0.6), 
@@ -667,26 +1026,27 @@ def single_graph_results(graph: Graph,
     
     # Solve variable reduction
     # ----------------------------------------
-    matrix_size = graph.A_L2[graph.distinct_monomials_L2[0]].shape[0]
-    for rate in np.linspace(range[0], range[1], iterations):
-        slack = True
-        if rate > 0.5:
-            slack = True
-        random_projector = rp.RandomProjector(
-            round(matrix_size * rate), matrix_size, type=type_variable
-        )
-        rp_solution = projected_second_level_stable_set_problem_sdp(
-            graph, random_projector, verbose=False, slack=slack
-        )
-
-        print(
-            "{: <18} {: >10} {: >8.2f} {: >8.2f}".format(
-                "Projection " + str(round(rate, 2)),
-                rp_solution["size_psd_variable"],
-                rp_solution["objective"],
-                rp_solution["computation_time"],
+    # The projected solves of the sweep are independent, so run them in
+    # a process pool and print the results in rate order.
+    A_L2 = graph.A_L2
+    matrix_size = A_L2[graph.distinct_monomials_L2[0]].shape[0]
+    rates = np.linspace(range[0], range[1], iterations)
+    tasks = [(rate, type_variable) for rate in rates]
+    max_workers = max(1, (os.cpu_count() or 1) // 2)
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=min(len(tasks), max_workers),
+        initializer=_init_sweep_worker,
+        initargs=(graph,),
+    ) as executor:
+        for rate, rp_solution in executor.map(solve_projected_rate, tasks):
+            print(
+                "{: <18} {: >10} {: >8.2f} {: >8.2f}".format(
+                    "Projection " + str(round(rate, 2)),
+                    rp_solution["size_psd_variable"],
+                    rp_solution["objective"],
+                    rp_solution["computation_time"],
+                )
             )
-        )
     print("." * 80)
 
     # Solve constraint aggregation
@@ -753,9 +1113,7 @@ def single_graph_results(graph: Graph,
 
 if __name__ == "__main__":
     directory = "graphs/generalised_petersen_20_2_complement"
-    file_path = directory + "/graph.pkl"
-    with open(file_path, "rb") as file:
-        graph = pickle.load(file)
+    graph = generate_graphs.load_graph(directory)
 
     # graph = generate_graphs.generate_cordones(100, complement=True, save=False, level=1)
     graph = generate_graphs.generate_generalised_petersen(